@@ -0,0 +1,99 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import Scraper
+import Rankings
+import Fixer
+import Writer
+
+class Screen:
+    "A FINVIZ screen and the factors used to rank the stocks it returns"
+
+    def __init__(self, name, filters='cap_smallover',
+        factors=Rankings.trendingValueFactors):
+        # Name of the screen, used to prefix the .csv output files
+        self.name = name
+        # FINVIZ screener filters (e.g. 'cap_smallover' or 'cap_largeover')
+        self.filters = filters
+        # Stock attributes scored when ranking (see Rankings.rankByFactors)
+        self.factors = factors
+        # Momentum-weighted top decile output
+        self.topCsvPath = name + '_top.csv'
+        # All stocks output
+        self.allCsvPath = name + '_stocks.csv'
+
+def importFinvizScreen(filters):
+    "Imports every page of stocks returned by a FINVIZ screen and returns \
+    them as a list of Stock objects"
+
+    html = Scraper.importHtml(Scraper.finvizUrl(filters))
+    nPages = Scraper.readFinvizPageCount(html)
+
+    stocks = []
+    Scraper.importFinvizPage(html, stocks)
+
+    # The first page of stocks (20 stocks) has been imported. Now import the
+    # rest of them
+    for i in range(1, nPages):
+        print('Importing FINVIZ metrics for ' + filters + ' from page ' +
+            str(i + 1) + ' of ' + str(nPages) + '...', flush=True)
+
+        html = Scraper.importHtml(Scraper.finvizUrl(filters, i*20+1))
+        Scraper.importFinvizPage(html, stocks)
+
+    # Drop any stock listed on more than one page
+    ticks = set()
+    unique = []
+    for stock in stocks:
+        if stock.tick not in ticks:
+            ticks.add(stock.tick)
+            unique.append(stock)
+
+    return unique
+
+def mergeStocks(stocks, bufferList):
+    "Extends stocks with the stocks in bufferList that it doesn't already \
+    hold. Returns the tickers of bufferList"
+
+    ticks = set([o.tick for o in stocks])
+    for stock in bufferList:
+        if stock.tick not in ticks:
+            ticks.add(stock.tick)
+            stocks.append(stock)
+
+    return [o.tick for o in bufferList]
+
+def runScreen(screen, ticks, stocksByTick):
+    "Fixes, ranks, and saves the stocks belonging to a screen. Stocks are \
+    copied from the shared database so that each screen may modify its own."
+
+    stocks = [copy.copy(stocksByTick[tick]) for tick in ticks]
+
+    # A number of stocks may have broken metrics. Fix these (i.e. assign out-of-
+    # bounds values) before sorting
+    stocks = Fixer.fixBrokenMetrics(stocks)
+
+    # Calculate shareholder Yield
+    for stock in stocks:
+        stock.shy = stock.div + stock.bby
+
+    stocks = Rankings.rankByFactors(stocks, screen.factors)
+    topDecile = Rankings.sortTopDecileByMomentum(stocks)
+
+    Writer.writeCSV(screen.topCsvPath, topDecile)
+    Writer.writeCSV(screen.allCsvPath, stocks)
+
+    return screen
+
+def runScreens(screens, screenTicks, stocks):
+    "Runs each screen on its tickers in parallel. screenTicks holds the list \
+    of tickers for each screen, all of which must be found in stocks."
+
+    stocksByTick = dict([(o.tick, o) for o in stocks])
+
+    with ThreadPoolExecutor(max_workers=len(screens)) as executor:
+        futures = [executor.submit(runScreen, screens[i], screenTicks[i],
+            stocksByTick) for i in range(len(screens))]
+
+        # Re-raise any error encountered by a screen
+        return [f.result() for f in futures]
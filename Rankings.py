@@ -10,3 +10,61 @@ def rankByValue(X):
     ranks = order.argsort()
 
     return ranks
+
+# Metrics scored by the Trending Value strategy. Lower values score better
+# unless the metric is listed in higherIsBetter.
+trendingValueFactors = ['pe', 'ps', 'pb', 'pfcf', 'evebitda', 'shy']
+higherIsBetter = ['shy']
+
+def rankByFactors(stocks, factors=trendingValueFactors):
+    "Scores each stock 0-100 on every factor, sums the scores, and assigns \
+    the overall rank and value composite to each stock. Returns the stocks \
+    sorted by rank (best first)."
+
+    nStocks = len(stocks)
+
+    # Time to rank! Lowest value gets 100, except for metrics such as
+    # shareholder yield where the highest value gets 100
+    rankStock = numpy.zeros(nStocks)
+    for factor in factors:
+        ranks = rankByValue([getattr(o, factor) for o in stocks])
+        if factor in higherIsBetter:
+            rankStock = rankStock + 100 * (ranks / nStocks)
+        else:
+            rankStock = rankStock + 100 * (1 - ranks / nStocks)
+
+    # Rank 'em
+    rankOverall = rankByValue(rankStock)
+    # Calculate Value Composite - higher the better
+    valueComposite = 100 * rankOverall / len(rankStock)
+    # Reverse indices - lower index -> better score
+    rankOverall = [len(rankStock) - 1 - x for x in rankOverall]
+
+    # Assign to stocks
+    for i in range(nStocks):
+        stocks[i].rank = rankOverall[i]
+        stocks[i].vc = round(valueComposite[i], 2)
+
+    # Sort all stocks by normalized rank
+    return [x for (y, x) in sorted(zip(rankOverall, stocks))]
+
+def sortTopDecileByMomentum(stocks):
+    "Returns the top decile of a list of ranked stocks, sorted by momentum. \
+    O'Shaughnessey historically uses 25 stocks to hold."
+
+    dec = int(len(stocks) / 10)
+    topDecile = []
+
+    # Store temporary momentums from top decile for sorting reasons
+    moms = [o.mom for o in stocks[:dec]]
+
+    # Sort top decile by momentum
+    for i in range(dec):
+        # Get index of top momentum performer in top decile
+        topMomInd = moms.index(max(moms))
+        # Sort
+        topDecile.append(stocks[topMomInd])
+        # Remove top momentum performer from further consideration
+        moms[topMomInd] = -100
+
+    return topDecile
@@ -12,6 +12,33 @@ def importHtml(url):
 
     return html
 
+def finvizUrl(filters, row=None):
+    "Returns the FINVIZ screener URL for the given filters (e.g. \
+    'cap_smallover'). If a row is given, the page starting at that row is \
+    requested"
+
+    url = 'http://finviz.com/screener.ashx?v=152&f=' + filters + '&ft=4'
+    if row is not None:
+        url = url + '&r=' + str(row)
+
+    return url + '&c=0,1,2,6,7,10,11,13,14,45,65'
+
+def readFinvizPageCount(html):
+    "Returns the number of pages of stocks listed on a FINVIZ HTML page, or -1 \
+    if the page selector can't be found"
+
+    nPages = -1
+    for line in html:
+        if line[0:40] == '<option selected="selected" value=1>Page':
+            # Find indices
+            b1 = line.index('/') + 1
+            b2 = b1 + line[b1:].index('<')
+            # Number of pages containing stock data
+            nPages = int(line[b1:b2])
+            break
+
+    return nPages
+
 def importFinvizPage(html, stocks):
     "Imports data from a FINVIZ HTML page and stores in the list of Stock \
     objects"
@@ -82,6 +109,58 @@ def _toFloat(line):
 
     return num
 
+def importYahooEVEBITDA(tick):
+    "Scrapes the Key Statistics page from Yahoo! Finance and returns the \
+    EV/EBITDA ratio of the given ticker"
+
+    url = 'http://finance.yahoo.com/q/ks?s=' + tick + '+Key+Statistics'
+    html = importHtml(url)
+
+    evebitda = 0.0
+    for line in html:
+        # Check no value
+        if 'There is no Key Statistics' in line or \
+        'Get Quotes Results for' in line or \
+        'Changed Ticker Symbol' in line or \
+        '</html>' in line:
+            # Non-financial file (e.g. mutual fund) or
+            # Ticker not located or
+            # End of html page
+            evebitda = 1000
+            break
+        elif 'Enterprise Value/EBITDA' in line:
+            # Line contains EV/EBITDA data
+            evebitda = readYahooEVEBITDA(line)
+            break
+
+    return evebitda
+
+def importYahooBBY(tick):
+    "Scrapes the Cash Flow page from Yahoo! Finance and returns the total buys \
+    and sells of the given ticker. Result will still need to be divided by \
+    market cap"
+
+    url = 'http://finance.yahoo.com/q/cf?s=' + tick + '&ql=1'
+    html = importHtml(url)
+
+    totalBuysAndSells = 0
+    for line in html:
+        # Check no value
+        if 'There is no Cash Flow' in line or \
+        'Get Quotes Results for' in line or \
+        'Changed Ticker Symbol' in line or \
+        '</html>' in line:
+            # Non-financial file (e.g. mutual fund) or
+            # Ticker not located or
+            # End of html page
+            break
+        elif 'Sale Purchase of Stock' in line:
+            # Line contains Sale/Purchase of Stock information
+            totalBuysAndSells = readYahooBBY(line)
+            break
+
+    return totalBuysAndSells
+
 def readYahooEVEBITDA(line):
     "Returns EV/EBITDA data from Yahoo! Finance HTML line"
 
@@ -56,20 +56,11 @@ stocks = pickler.loadPickledFile(pklFileName)
 
 # Scrape data from FINVIZ. Certain presets have been established (see direct
 # link for more details)
-url = 'http://finviz.com/screener.ashx?v=152&f=cap_smallover&' + \
-    'ft=4&c=0,1,2,6,7,10,11,13,14,45,65'
-html = Scraper.importHtml(url)
+filters = 'cap_smallover'
+html = Scraper.importHtml(Scraper.finvizUrl(filters))
 
 # Parse the HTML for the number of pages from which we'll pull data
-nPages = -1
-for line in html:
-    if line[0:40] == '<option selected="selected" value=1>Page':
-        # Find indices
-        b1 = line.index('/') + 1
-        b2 = b1 + line[b1:].index('<')
-        # Number of pages containing stock data
-        nPages = int(line[b1:b2])
-        break
+nPages = Scraper.readFinvizPageCount(html)
 
 # Parse data from table on the first page of stocks and store in the database,
 # but only if no data was pickled
@@ -88,9 +79,7 @@ for i in range(iS, nPages + 1):
             str(nPages) + '...', file=stdout, flush=True)
 
         # Scrape data as before
-        url = 'http://finviz.com/screener.ashx?v=152&f=cap_smallover&ft=4&r=' + \
-            str(i*20+1) + '&c=0,1,2,6,7,10,11,13,14,45,65'
-        html = Scraper.importHtml(url)
+        html = Scraper.importHtml(Scraper.finvizUrl(filters, i*20+1))
 
         # Import stock metrics from page into a buffer
         bufferList = []
@@ -123,26 +112,7 @@ for i in range(iS, nStocks):
             file=stdout, flush=True)
 
         # Scrape data from Yahoo! Finance
-        url = 'http://finance.yahoo.com/q/ks?s=' + stocks[i].tick + '+Key+Statistics'
-        html = Scraper.importHtml(url)
-
-        # Parse data
-        for line in html:
-            # Check no value
-            if 'There is no Key Statistics' in line or \
-            'Get Quotes Results for' in line or \
-            'Changed Ticker Symbol' in line or \
-            '</html>' in line:
-                # Non-financial file (e.g. mutual fund) or
-                # Ticker not located or
-                # End of html page
-                stocks[i].evebitda = 1000
-                break
-            elif 'Enterprise Value/EBITDA' in line:
-                # Line contains EV/EBITDA data
-                evebitda = Scraper.readYahooEVEBITDA(line)
-                stocks[i].evebitda = evebitda
-                break
+        stocks[i].evebitda = Scraper.importYahooEVEBITDA(stocks[i].tick)
     except:
         # Error encountered. Pickle stocks for later loading
         pickler.setError(source, i, stocks)
@@ -165,25 +135,7 @@ for i in range(iS, nStocks):
             file=stdout, flush=True)
 
         # Scrape data from Yahoo! Finance
-        url = 'http://finance.yahoo.com/q/cf?s=' + stocks[i].tick + '&ql=1'
-        html = Scraper.importHtml(url)
-
-        # Parse data
-        totalBuysAndSells = 0
-        for line in html:
-            # Check no value
-            if 'There is no Cash Flow' in line or \
-            'Get Quotes Results for' in line or \
-            'Changed Ticker Symbol' in line or \
-            '</html>' in line:
-                # Non-financial file (e.g. mutual fund) or
-                # Ticker not located or
-                # End of html page
-                break
-            elif 'Sale Purchase of Stock' in line:
-                # Line contains Sale/Purchase of Stock information
-                totalBuysAndSells = Scraper.readYahooBBY(line)
-                break
+        totalBuysAndSells = Scraper.importYahooBBY(stocks[i].tick)
 
         # Calculate BBY as a percentage of current market cap
         bby = round(-totalBuysAndSells / stocks[i].mktcap * 100, 2)
@@ -211,53 +163,16 @@ if not pickler.hasErrorOccurred:
     for i in range(nStocks):
         stocks[i].shy = stocks[i].div + stocks[i].bby
 
-    # Time to rank! Lowest value gets 100
-    rankPE = 100 * (1 - Rankings.rankByValue([o.pe for o in stocks]) / nStocks)
-    rankPS = 100 * (1 - Rankings.rankByValue([o.ps for o in stocks]) / nStocks)
-    rankPB = 100 * (1 - Rankings.rankByValue([o.pb for o in stocks]) / nStocks)
-    rankPFCF = 100 * (1 - Rankings.rankByValue([o.pfcf for o in stocks]) / nStocks)
-    rankEVEBITDA = 100 * (1 - Rankings.rankByValue([o.evebitda for o in stocks]) / nStocks)
-
-    # Shareholder yield ranked with highest getting 100
-    rankSHY = 100 * (Rankings.rankByValue([o.shy for o in stocks]) / nStocks)
-
-    # Rank total stock valuation
-    rankStock = rankPE + rankPS + rankPB + rankPFCF + rankEVEBITDA + rankSHY
-
-    # Rank 'em
-    rankOverall = Rankings.rankByValue(rankStock)
-    # Calculate Value Composite - higher the better
-    valueComposite = 100 * rankOverall / len(rankStock)
-    # Reverse indices - lower index -> better score
-    rankOverall = [len(rankStock) - 1 - x for x in rankOverall]
-
-    # Assign to stocks
-    for i in range(nStocks):
-        stocks[i].rank = rankOverall[i]
-        stocks[i].vc = round(valueComposite[i], 2)
+    # Score each stock on the Trending Value metrics and sort all stocks by
+    # normalized rank
+    stocks = Rankings.rankByFactors(stocks)
 
     print('Sorting stocks...')
 
-    # Sort all stocks by normalized rank
-    stocks = [x for (y, x) in sorted(zip(rankOverall, stocks))]
-
     # Sort top decile by momentum factor. O'Shaughnessey historically uses 25
     # stocks to hold. The top decile is printed, and the user may select the top 25
     # (or any n) from the .csv file.
-    dec = int(nStocks / 10)
-    topDecile = []
-
-    # Store temporary momentums from top decile for sorting reasons
-    moms = [o.mom for o in stocks[:dec]]
-
-    # Sort top decile by momentum
-    for i in range(dec):
-        # Get index of top momentum performer in top decile
-        topMomInd = moms.index(max(moms))
-        # Sort
-        topDecile.append(stocks[topMomInd])
-        # Remove top momentum performer from further consideration
-        moms[topMomInd] = -100
+    topDecile = Rankings.sortTopDecileByMomentum(stocks)
 
     print('Saving stocks...')
 
@@ -0,0 +1,127 @@
+# Batch mode for oshaugh.py
+#
+# Runs several variants of the Trending Value strategy at once. Each screen
+# pairs a set of FINVIZ filters with the factors used to rank its stocks.
+# The union of tickers returned by all screens is scraped from Yahoo! Finance
+# exactly once, and the shared data is then fixed, ranked, and saved by each
+# screen in parallel. Results are saved to <name>_top.csv and
+# <name>_stocks.csv for each screen.
+#
+# See oshaugh.py for background and LICENSE.
+
+from sys import stdout
+
+from Batch import Screen
+import Batch
+import Pickler
+import Scraper
+
+# Screens to run. Edit these to add or remove variants of the strategy.
+screens = [
+    Screen('smallover'),
+    Screen('largeover', filters='cap_largeover'),
+    Screen('smallover_nopfcf', factors=['pe', 'ps', 'pb', 'evebitda', 'shy'])
+]
+nScreens = len(screens)
+
+# HTML error code handler. The pickled data holds the tickers found by each
+# screen along with the shared stock database.
+pklFileName = 'tmpbatch.pkl'
+pickler = Pickler.Pickler()
+
+data = pickler.loadPickledFile(pklFileName)
+if data:
+    (screenTicks, stocks) = data
+else:
+    screenTicks = []
+    stocks = []
+
+# Scrape data from FINVIZ one screen at a time. Stocks found by more than one
+# screen are only stored once.
+source = Pickler.PickleSource.FINVIZ
+iS = pickler.getIndex(source, 0, nScreens)
+
+for i in range(iS, nScreens):
+    try:
+        print('Importing FINVIZ screen ' + screens[i].name + ' (' + str(i) +
+            '/' + str(nScreens - 1) + ')...', file=stdout, flush=True)
+
+        # Import the whole screen into a buffer
+        bufferList = Batch.importFinvizScreen(screens[i].filters)
+
+        # If no errors encountered, add new stocks to the shared database
+        screenTicks.append(Batch.mergeStocks(stocks, bufferList))
+    except:
+        # Error encountered. Pickle stocks for later loading
+        pickler.setError(source, i, [screenTicks, stocks])
+        break
+
+
+# FINVIZ stock metrics successfully imported
+print('\n')
+
+# Store number of unique stocks in list
+nStocks = len(stocks)
+
+# Handle pickle file
+source = Pickler.PickleSource.YHOOEV
+iS = pickler.getIndex(source, 0, nStocks)
+
+# Grab EV/EBITDA metrics from Yahoo! Finance
+for i in range(iS, nStocks):
+    try:
+        # Print dynamic progress message
+        print('Importing Key Statistics for ' + stocks[i].tick +
+            ' (' + str(i) + '/' + str(nStocks - 1) + ') from Yahoo! Finance...', \
+            file=stdout, flush=True)
+
+        # Scrape data from Yahoo! Finance
+        stocks[i].evebitda = Scraper.importYahooEVEBITDA(stocks[i].tick)
+    except:
+        # Error encountered. Pickle stocks for later loading
+        pickler.setError(source, i, [screenTicks, stocks])
+        break
+
+
+# Yahoo! Finance EV/EBITDA successfully imported
+print('\n')
+
+# Handle pickle file
+source = Pickler.PickleSource.YHOOBBY
+iS = pickler.getIndex(source, 0, nStocks)
+
+# Grab BBY metrics from Yahoo! Finance
+for i in range(iS, nStocks):
+    try:
+        # Print dynamic progress message
+        print('Importing Cash Flow for ' + stocks[i].tick +
+            ' (' + str(i) + '/' + str(nStocks - 1) + ') from Yahoo! Finance...', \
+            file=stdout, flush=True)
+
+        # Scrape data from Yahoo! Finance
+        totalBuysAndSells = Scraper.importYahooBBY(stocks[i].tick)
+
+        # Calculate BBY as a percentage of current market cap
+        bby = round(-totalBuysAndSells / stocks[i].mktcap * 100, 2)
+        stocks[i].bby = bby
+    except:
+        # Error encountered. Pickle stocks for later loading
+        pickler.setError(source, i, [screenTicks, stocks])
+        break
+
+
+# Yahoo! Finance BBY successfully imported
+
+if not pickler.hasErrorOccurred:
+    # All data imported
+    print('\n')
+    print('Fixing, ranking, and saving ' + str(nScreens) + ' screens...')
+
+    # Fan the shared data out to each screen
+    Batch.runScreens(screens, screenTicks, stocks)
+
+    print('\n')
+    print('Complete.')
+    for screen in screens:
+        print(screen.name + ': top decile saved to ' + screen.topCsvPath +
+            ', all stocks saved to ' + screen.allCsvPath)